@@ -0,0 +1,27 @@
+"""Asynchronous Python client for TechnoVE."""
+
+import asyncio
+
+from technove import close_shared, get_shared
+
+STATION_IP = "192.168.10.162"
+
+
+async def print_status() -> None:
+    """Print the status of the station, reusing the shared client's session."""
+    device = await get_shared(STATION_IP).update()
+    print(device.info.status)
+
+
+async def main() -> None:
+    """Show example on polling your TechnoVE station with a shared client."""
+    try:
+        for _ in range(3):
+            await print_status()
+            await asyncio.sleep(5)
+    finally:
+        await close_shared()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
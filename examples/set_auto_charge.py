@@ -14,25 +14,21 @@ async def main() -> None:
         print(initial_value)
 
         print("Activating auto_charge...")
-        await technove.set_auto_charge(enabled=True)
-        # Sleep is needed because the station takes a bit of time to fully
+        # The delay is needed because the station takes a bit of time to fully
         # enable the automatic charging feature.
-        await asyncio.sleep(2)
-        device = await technove.update()
+        device = await technove.batch(technove.set_auto_charge(enabled=True), delay=2)
         print(device.info.auto_charge)
 
         print("Disabling auto_charge...")
-        await technove.set_auto_charge(enabled=False)
-        await asyncio.sleep(2)
-        device = await technove.update()
+        device = await technove.batch(technove.set_auto_charge(enabled=False), delay=2)
         print(device.info.auto_charge)
 
         if device.info.auto_charge != initial_value:
             # Sets the initial value back, just to be nice
             print("Setting back to initial value...")
-            await technove.set_auto_charge(enabled=initial_value)
-            await asyncio.sleep(2)
-            device = await technove.update()
+            device = await technove.batch(
+                technove.set_auto_charge(enabled=initial_value), delay=2
+            )
             print(device.info.auto_charge)
 
 
@@ -14,31 +14,27 @@ async def main() -> None:
         print(initial_value)
 
         print("Setting max current to maximum...")
-        await technove.set_max_current(device.info.max_station_current)
-        # Sleep is needed because the station takes a bit of time to fully
+        # The delay is needed because the station takes a bit of time to fully
         # set the correct value.
-        await asyncio.sleep(10)
-        device = await technove.update()
+        device = await technove.batch(
+            technove.set_max_current(device.info.max_station_current), delay=10
+        )
         print(device.info.max_current)
 
         print("Setting max current to minimum...")
-        await technove.set_max_current(MIN_CURRENT)
-        await asyncio.sleep(10)
-        device = await technove.update()
+        device = await technove.batch(technove.set_max_current(MIN_CURRENT), delay=10)
         print(device.info.max_current)
 
         print("Setting max current to odd value...")
-        await technove.set_max_current(15)
-        await asyncio.sleep(10)
-        device = await technove.update()
+        device = await technove.batch(technove.set_max_current(15), delay=10)
         print(device.info.max_current)
 
         if device.info.max_current != initial_value:
             # Sets the initial value back, just to be nice
             print("Setting back to initial value...")
-            await technove.set_max_current(initial_value)
-            await asyncio.sleep(10)
-            device = await technove.update()
+            device = await technove.batch(
+                technove.set_max_current(initial_value), delay=10
+            )
             print(device.info.max_current)
 
 
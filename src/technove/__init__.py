@@ -7,7 +7,7 @@ from .exceptions import (
     TechnoVEOutOfBoundError,
 )
 from .models import Info, Station, Status
-from .technove import MIN_CURRENT, TechnoVE
+from .technove import MIN_CURRENT, TechnoVE, close_shared, get_shared
 
 __all__ = [
     "Station",
@@ -19,4 +19,6 @@ __all__ = [
     "TechnoVEConnectionTimeoutError",
     "TechnoVEError",
     "TechnoVEOutOfBoundError",
+    "close_shared",
+    "get_shared",
 ]
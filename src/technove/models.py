@@ -17,26 +17,27 @@ class Status(Enum):
     HIGH_CHARGE_PERIOD = "high_charge_period"
 
     @classmethod
-    def build(cls: type[Status], status: int) -> Status:
+    def build(cls: type[Status], status: int | None) -> Status:
         """Parse the status code int to a Status object."""
-        statuses = {
-            None: Status.UNKNOWN,
-            65: Status.UNPLUGGED,
-            66: Status.PLUGGED_WAITING,
-            67: Status.PLUGGED_CHARGING,
-            83: Status.OUT_OF_ACTIVATION_PERIOD,
-            84: Status.HIGH_CHARGE_PERIOD,
-        }
+        return _STATUS_MAP.get(status, cls.UNKNOWN)
 
-        if status in statuses:
-            return statuses[status]
 
-        return Status.UNKNOWN
+# Status codes sent by the station API, mapped to their Status.
+_STATUS_MAP: dict[int | None, Status] = {
+    None: Status.UNKNOWN,
+    65: Status.UNPLUGGED,
+    66: Status.PLUGGED_WAITING,
+    67: Status.PLUGGED_CHARGING,
+    83: Status.OUT_OF_ACTIVATION_PERIOD,
+    84: Status.HIGH_CHARGE_PERIOD,
+}
 
 
 class Station:
     """Object holding all information from a TechnoVE Station."""
 
+    __slots__ = ("info",)
+
     info: Info
 
     def __init__(self, data: dict[str, Any]) -> None:
@@ -65,7 +66,37 @@ class Station:
         return self
 
 
-@dataclass
+# Info attributes, with the API key they are read from and their default value.
+# The status is parsed separately, see Status.build.
+_INFO_FIELDS: tuple[tuple[str, str, Any], ...] = (
+    ("auto_charge", "auto_charge", False),
+    ("conflict_in_sharing_config", "conflictInSharingConfig", False),
+    ("current", "current", 0),
+    ("energy_session", "energySession", 0),
+    ("energy_total", "energyTotal", 0),
+    ("high_charge_period_active", "highChargePeriodActive", False),
+    ("mac_address", "id", "unknown"),
+    ("in_sharing_mode", "inSharingMode", False),
+    ("is_battery_protected", "isBatteryProtected", False),
+    ("is_session_active", "isSessionActive", False),
+    ("is_static_ip", "isStaticIp", False),
+    ("is_up_to_date", "isUpToDate", True),
+    ("last_charge", "lastCharge", ""),
+    ("max_charge_percentage", "maxChargePourcentage", 0),
+    ("max_current", "maxCurrent", 0),
+    ("max_station_current", "maxStationCurrent", 0),
+    ("name", "name", "Unknown"),
+    ("network_ssid", "network_ssid", "Unknown"),
+    ("normal_period_active", "normalPeriodActive", False),
+    ("rssi", "rssi", 0),
+    ("time", "time", 0),
+    ("version", "version", "Unknown"),
+    ("voltage_in", "voltageIn", 0),
+    ("voltage_out", "voltageOut", 0),
+)
+
+
+@dataclass(slots=True, frozen=True)
 class Info:  # pylint: disable=too-many-instance-attributes
     """Object holding information from a TechnoVE Station."""
 
@@ -107,30 +138,11 @@ class Info:  # pylint: disable=too-many-instance-attributes
         -------
             A station info object.
         """
-        return Info(
-            auto_charge=data.get("auto_charge", False),
-            conflict_in_sharing_config=data.get("conflictInSharingConfig", False),
-            current=data.get("current", 0),
-            energy_session=data.get("energySession", 0),
-            energy_total=data.get("energyTotal", 0),
-            high_charge_period_active=data.get("highChargePeriodActive", False),
-            mac_address=data.get("id", "unknown"),
-            in_sharing_mode=data.get("inSharingMode", False),
-            is_battery_protected=data.get("isBatteryProtected", False),
-            is_session_active=data.get("isSessionActive", False),
-            is_static_ip=data.get("isStaticIp", False),
-            is_up_to_date=data.get("isUpToDate", True),
-            last_charge=data.get("lastCharge", ""),
-            max_charge_percentage=data.get("maxChargePourcentage", 0),
-            max_current=data.get("maxCurrent", 0),
-            max_station_current=data.get("maxStationCurrent", 0),
-            name=data.get("name", "Unknown"),
-            network_ssid=data.get("network_ssid", "Unknown"),
-            normal_period_active=data.get("normalPeriodActive", False),
-            rssi=data.get("rssi", 0),
-            status=Status.build(data.get("status", None)),
-            time=data.get("time", 0),
-            version=data.get("version", "Unknown"),
-            voltage_in=data.get("voltageIn", 0),
-            voltage_out=data.get("voltageOut", 0),
-        )
+        info = Info.__new__(Info)
+        # Info is frozen, fields are set the same way its generated __init__ does.
+        setter = object.__setattr__
+        get = data.get
+        for attr, key, default in _INFO_FIELDS:
+            setter(info, attr, get(key, default))
+        setter(info, "status", Status.build(get("status")))
+        return info
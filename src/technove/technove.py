@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import asyncio
-import json
-from dataclasses import dataclass
-from typing import Any, Final, Self
+import contextlib
+import functools
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Final, Self
 
 import aiohttp
-import backoff
+import orjson
 from yarl import URL
 
 from .exceptions import (
@@ -19,12 +21,53 @@ from .exceptions import (
 )
 from .models import Station
 
+if TYPE_CHECKING:
+    from collections.abc import Awaitable
+
 # TechnoVE stations don't allow setting values lower than 8. Calling the API with
 # a smaller value will just be ignored.
 MIN_CURRENT: Final[int] = 8
 
+# Headers sent with every request to the station, and with requests having a
+# JSON body.
+HEADERS: Final[dict[str, str]] = {
+    "Accept": "application/json, text/plain, */*",
+}
+JSON_HEADERS: Final[dict[str, str]] = {
+    **HEADERS,
+    "Content-Type": "application/json",
+}
+
+# Maximum time, in seconds, to wait for a connection to the station. Stations
+# are on the local network, so an unreachable one is detected quickly.
+CONNECT_TIMEOUT: Final[float] = 1.0
+
+# Maximum delay, in seconds, between two tries of a request failing with a
+# connection error.
+REQUEST_BACKOFF_MAX: Final[float] = 8.0
+
+
+@functools.lru_cache(maxsize=16)
+def _url_root(station_ip: str) -> str:
+    """Return the root URL of a station.
+
+    Built with yarl so the station IP is validated and IPv6 addresses are
+    bracketed, then extended with plain string concatenation.
+    """
+    return str(URL.build(scheme="http", host=station_ip, port=80))
+
+
+@functools.lru_cache(maxsize=16)
+def _client_timeout(request_timeout: float) -> aiohttp.ClientTimeout:
+    """Return the timeouts of a request allowed to last `request_timeout`."""
+    return aiohttp.ClientTimeout(
+        total=request_timeout,
+        sock_connect=min(CONNECT_TIMEOUT, request_timeout),
+        sock_read=request_timeout,
+    )
+
 
-@dataclass
+@dataclass(slots=True)
 class TechnoVE:
     """Main class for handling connections with TechnoVE."""
 
@@ -33,10 +76,17 @@ class TechnoVE:
     request_timeout: float = 8.0
     _close_session: bool = False
     station: Station | None = None
-
-    @backoff.on_exception(
-        backoff.expo, TechnoVEConnectionError, max_tries=3, logger=None
+    cache_ttl: float = 0.0
+    max_inflight: int = 4
+    max_retries: int = 2
+    backoff_base: float = 0.5
+    _last_fetch: float = field(default=float("-inf"), init=False, repr=False)
+    _generation: int = field(default=0, init=False, repr=False)
+    _semaphore: asyncio.Semaphore | None = field(default=None, init=False, repr=False)
+    _update_task: asyncio.Task[Station] | None = field(
+        default=None, init=False, repr=False
     )
+
     async def request(
         self,
         uri: str = "",
@@ -46,7 +96,11 @@ class TechnoVE:
         """Handle a request to a TechnoVE station.
 
         A generic method for sending/handling HTTP requests done gainst
-        the TechnoVE station.
+        the TechnoVE station. At most `max_inflight` requests are sent at a
+        time, this limit is fixed once the first request was sent. Connection
+        errors are retried up to `max_retries` times, waiting `backoff_base`
+        seconds before the first retry and twice as long before each of the
+        following ones.
 
         Args:
         ----
@@ -68,42 +122,84 @@ class TechnoVE:
             TechnoVEError: Received an unexpected response from the TechnoVE station.
 
         """
-        url = URL.build(scheme="http", host=self.station_ip, port=80, path=uri)
+        url = _url_root(self.station_ip) + uri
+
+        for attempt in range(self.max_retries):
+            try:
+                async with self._limiter():
+                    return await self._send(url, method, data)
+            except TechnoVEConnectionError:  # noqa: PERF203
+                await asyncio.sleep(
+                    min(REQUEST_BACKOFF_MAX, self.backoff_base * 2**attempt)
+                )
+        async with self._limiter():
+            return await self._send(url, method, data)
 
-        headers = {
-            "Accept": "application/json, text/plain, */*",
-        }
+    def _limiter(self) -> asyncio.Semaphore:
+        """Return the semaphore allowing `max_inflight` requests at a time.
 
-        if self.session is None:
-            self.session = aiohttp.ClientSession()
-            self._close_session = True
+        The semaphore is created by the first request, changing `max_inflight`
+        after that has no effect.
+
+        Returns
+        -------
+            The semaphore to hold while sending a request to the station.
+
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_inflight)
+        return self._semaphore
+
+    async def _send(
+        self,
+        url: str,
+        method: str,
+        data: dict[str, Any] | None,
+    ) -> Any:
+        """Send a single request to the TechnoVE station, without retrying.
+
+        Args:
+        ----
+            url: Full URL of the request.
+            method: HTTP method to use for the request.
+            data: Dictionary of data to send to the TechnoVE station.
+
+        Returns:
+        -------
+            The decoded response from the TechnoVE station.
+
+        """
+        session = self._ensure_session()
+
+        body = None
+        headers = HEADERS
+        if data is not None:
+            body = orjson.dumps(data)
+            headers = JSON_HEADERS
 
         try:
-            async with asyncio.timeout(self.request_timeout):
-                response = await self.session.request(
-                    method,
-                    url,
-                    json=data,
-                    headers=headers,
-                )
+            response = await session.request(
+                method,
+                url,
+                data=body,
+                headers=headers,
+                timeout=_client_timeout(self.request_timeout),
+            )
 
             content_type = response.headers.get("Content-Type", "")
-            if response.status // 100 in [4, 5]:
+            if response.status >= 400:
                 contents = await response.read()
-                response.close()
 
+                error = None
                 if content_type == "application/json":
-                    raise TechnoVEError(
-                        response.status,
-                        json.loads(contents.decode("utf8")),
-                    )
-                raise TechnoVEError(
-                    response.status,
-                    {"message": contents.decode("utf8")},
-                )
+                    with contextlib.suppress(orjson.JSONDecodeError):
+                        error = orjson.loads(contents)
+                if error is None:
+                    error = {"message": contents.decode("utf8", "replace")}
+                raise TechnoVEError(response.status, error)
 
             if "application/json" in content_type:
-                response_data = await response.json()
+                response_data = orjson.loads(await response.read())
             else:
                 response_data = await response.text()
 
@@ -122,23 +218,87 @@ class TechnoVE:
 
         return response_data
 
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        """Return the client session, creating a keep-alive one if needed.
+
+        A session created here is owned by this object and closed by `close`,
+        a new one is created if it is used again after that. Its connector
+        keeps idle connections to the station open so that consecutive polls
+        reuse the same socket.
+
+        Returns
+        -------
+            The aiohttp client session used to talk to the station.
+
+        """
+        if self.session is None or (self._close_session and self.session.closed):
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=self.max_inflight,
+                    keepalive_timeout=75,
+                ),
+            )
+            self._close_session = True
+        return self.session
+
     async def update(self) -> Station:
         """Get all information about the station in a single call.
 
         This method updates all the TechnoVE information available with a single
-        API call.
+        API call. Calls made while an update is already in progress wait for
+        that update instead of sending another request to the station, unless
+        a command was sent to the station after that update started.
+
+        When `cache_ttl` is set, the last station data is returned as is if it
+        was fetched less than `cache_ttl` seconds ago and no command was sent
+        to the station since.
 
         Returns
         -------
             TechnoVE station data.
 
         """
+        if (
+            self.station is not None
+            and time.monotonic() - self._last_fetch < self.cache_ttl
+        ):
+            return self.station
+        if self._update_task is None:
+            self._update_task = asyncio.create_task(self._fetch_station())
+            self._update_task.add_done_callback(self._update_done)
+        return await asyncio.shield(self._update_task)
+
+    async def _fetch_station(self) -> Station:
+        """Request the station information and store it in `station`.
+
+        Returns
+        -------
+            TechnoVE station data.
+
+        """
+        generation = self._generation
         data = await self.request("/station/get/info")
         if not data:
             msg = "No data was returned by the station"
             raise TechnoVEError(msg)
-        self.station = Station(data)
-        return self.station
+        station = Station(data)
+        # Data requested before a command was sent is still returned to the
+        # calls waiting for it, but doesn't replace newer data.
+        if generation == self._generation:
+            self.station = station
+            self._last_fetch = time.monotonic()
+        return station
+
+    def _update_done(self, task: asyncio.Task[Station]) -> None:
+        """Forget the finished update so the next call fetches fresh data."""
+        if self._update_task is task:
+            self._update_task = None
+
+    def _invalidate(self) -> None:
+        """Make the next update fetch data sent after the last command."""
+        self._generation += 1
+        self._update_task = None
+        self._last_fetch = float("-inf")
 
     async def set_auto_charge(self, *, enabled: bool) -> None:
         """Set whether the auto-charge feature is enabled or disabled.
@@ -151,6 +311,7 @@ class TechnoVE:
         await self.request(
             "/station/set/automatic", method="POST", data={"activated": enabled}
         )
+        self._invalidate()
 
     async def set_charging_enabled(self, *, enabled: bool) -> None:
         """Set whether the charging station is allowed to provide power or not.
@@ -171,6 +332,7 @@ class TechnoVE:
             raise TechnoVEError(msg)
         action = "start" if enabled else "stop"
         await self.request(f"/station/control/{action}")
+        self._invalidate()
 
     async def set_max_current(self, max_current: int) -> None:
         """Set the max current the station is allowed to provide.
@@ -184,28 +346,59 @@ class TechnoVE:
 
         Raises:
         ------
-            TechnoVEError: If in_sharing_mode is enabled.
             TechnoVEOutOfBoundError: If max_current is below 8 (See MIN_CURRENT).
             TechnoVEOutOfBoundError: If max_current is above max_station_current.
+            TechnoVEError: If in_sharing_mode is enabled.
 
         """
-        if self.station and self.station.info.in_sharing_mode:
-            msg = "Cannot set the max current when sharing mode is enabled."
-            raise TechnoVEError(msg)
+        # Bounds are checked first, so an invalid value is reported as such even
+        # when sharing mode is enabled.
         if max_current < MIN_CURRENT:
             msg = f"Max current needs to be greater than {MIN_CURRENT}."
             raise TechnoVEOutOfBoundError(msg)
-        if self.station and max_current > self.station.info.max_station_current:
+        info = self.station.info if self.station else None
+        if info and max_current > info.max_station_current:
             msg = (
                 "Max current needs to be equal or lower than "
-                f"{self.station.info.max_station_current}."
+                f"{info.max_station_current}."
             )
             raise TechnoVEOutOfBoundError(msg)
+        if info and info.in_sharing_mode:
+            msg = "Cannot set the max current when sharing mode is enabled."
+            raise TechnoVEError(msg)
         await self.request(
             "/station/control/partage",
             "POST",
             {" stationNumber": 1, "current": max_current},
         )
+        self._invalidate()
+
+    async def batch(self, *commands: Awaitable[None], delay: float = 0) -> Station:
+        """Send multiple commands, then refresh the station information once.
+
+        The commands are sent concurrently over the same session, at most
+        `max_inflight` at a time. Once they all completed, the station
+        information is fetched a single time instead of after every command.
+        This fetch is never served from `cache_ttl` or from an update that was
+        already in progress.
+
+        Args:
+        ----
+            commands: Pending commands, as returned by the setters. For example,
+                `technove.set_auto_charge(enabled=True)`.
+            delay: Seconds to wait before refreshing, to give the station time
+                to apply the commands.
+
+        Returns:
+        -------
+            TechnoVE station data.
+
+        """
+        await asyncio.gather(*commands)
+        self._invalidate()
+        if delay:
+            await asyncio.sleep(delay)
+        return await self.update()
 
     async def close(self) -> None:
         """Close open client session."""
@@ -220,6 +413,7 @@ class TechnoVE:
             The TechnoVE object.
 
         """
+        self._ensure_session()
         return self
 
     async def __aexit__(self, *_exc_info: object) -> None:
@@ -231,3 +425,37 @@ class TechnoVE:
 
         """
         await self.close()
+
+
+# Clients returned by `get_shared`, per event loop and then per station IP.
+# Entries are only removed by `close_shared`.
+_SHARED_CLIENTS: dict[asyncio.AbstractEventLoop, dict[str, TechnoVE]] = {}
+
+
+def get_shared(station_ip: str) -> TechnoVE:
+    """Return the TechnoVE client shared by the running event loop for a station.
+
+    The client, and its keep-alive session, is created on the first call and
+    reused by the following calls made from the same event loop. The clients
+    are kept until `close_shared` is called, which must be done before the
+    event loop stops to close the sessions and release the clients.
+
+    Args:
+    ----
+        station_ip: IP address of the TechnoVE station.
+
+    Returns:
+    -------
+        The shared TechnoVE object for this station.
+
+    """
+    clients = _SHARED_CLIENTS.setdefault(asyncio.get_running_loop(), {})
+    if (client := clients.get(station_ip)) is None:
+        client = clients[station_ip] = TechnoVE(station_ip)
+    return client
+
+
+async def close_shared() -> None:
+    """Close the clients shared by the running event loop."""
+    clients = _SHARED_CLIENTS.pop(asyncio.get_running_loop(), {})
+    await asyncio.gather(*(client.close() for client in clients.values()))
@@ -0,0 +1,72 @@
+"""Fixtures for the TechnoVE tests."""
+
+import asyncio
+import sys
+from collections.abc import AsyncGenerator, Callable, Generator
+from typing import Any
+
+import aiohttp
+import pytest
+from aresponses import ResponsesMockServer
+
+from technove import Station, TechnoVE
+
+# Run the tests on uvloop, like most production setups. It doesn't support Windows.
+if sys.platform != "win32":
+    import uvloop
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+@pytest.fixture
+async def session() -> AsyncGenerator[aiohttp.ClientSession, None]:
+    """Return an aiohttp session to pass to the TechnoVE client under test."""
+    async with aiohttp.ClientSession() as client_session:
+        yield client_session
+
+
+@pytest.fixture
+def make_technove(
+    session: aiohttp.ClientSession,
+) -> Callable[..., TechnoVE]:
+    """Return a factory of clients for the mocked station, using `session`."""
+
+    def _make_technove(**kwargs: Any) -> TechnoVE:
+        return TechnoVE("example.com", session=session, **kwargs)
+
+    return _make_technove
+
+
+@pytest.fixture
+def technove(make_technove: Callable[..., TechnoVE]) -> TechnoVE:
+    """Return a client for the mocked station with the default settings."""
+    return make_technove()
+
+
+@pytest.fixture(autouse=True)
+def _fail_on_unmatched_requests(
+    request: pytest.FixtureRequest,
+) -> Generator[None, None, None]:
+    """Fail tests that sent a request matching none of their aresponses routes.
+
+    The mock server answers those requests with a 500 error, which the client
+    may report as a different failure than the missing route.
+    """
+    if "aresponses" not in request.fixturenames:
+        yield
+        return
+    server: ResponsesMockServer = request.getfixturevalue("aresponses")
+    yield
+    server.assert_all_requests_matched()
+
+
+@pytest.fixture
+def station_no_auto_charge() -> Station:
+    """Return a station with the auto-charge feature disabled."""
+    return Station({"auto_charge": False})
+
+
+@pytest.fixture
+def station_sharing_off() -> Station:
+    """Return a 32A station that is not in sharing mode."""
+    return Station({"maxStationCurrent": 32, "inSharingMode": False})
@@ -1,7 +1,10 @@
 """Tests for `technove.TechnoVE`."""
 
+from dataclasses import FrozenInstanceError, asdict, fields
 
-from technove import Status
+import pytest
+
+from technove import Info, Status
 
 
 def test_status_build() -> None:
@@ -12,3 +15,19 @@ def test_status_build() -> None:
 def test_status_build_unknown() -> None:
     """Test status build with an unknown status code."""
     assert Status.build(42) == Status.UNKNOWN
+
+
+def test_info_frozen() -> None:
+    """Test that station info can't be modified once parsed."""
+    info = Info.from_dict({"name": "testing"})
+    with pytest.raises(FrozenInstanceError):
+        info.name = "changed"  # type: ignore[misc]
+
+
+def test_info_from_dict_defaults() -> None:
+    """Test that every Info field is set when the API omits it."""
+    info = Info.from_dict({})
+    assert asdict(info).keys() == {field.name for field in fields(Info)}
+    assert info.name == "Unknown"
+    assert info.is_up_to_date
+    assert info.status == Status.UNKNOWN
@@ -1,21 +1,25 @@
 """Tests for `technove.TechnoVE`."""
 
 import asyncio
+from collections.abc import Callable
 
 import aiohttp
 import pytest
 from aresponses import Response, ResponsesMockServer
 
-from technove import Station, Status, TechnoVE
+from technove import Station, Status, TechnoVE, close_shared, get_shared
 from technove.exceptions import (
     TechnoVEConnectionError,
+    TechnoVEConnectionTimeoutError,
     TechnoVEError,
     TechnoVEOutOfBoundError,
 )
 
 
 @pytest.mark.asyncio
-async def test_json_request(aresponses: ResponsesMockServer) -> None:
+async def test_json_request(
+    aresponses: ResponsesMockServer, technove: TechnoVE
+) -> None:
     """Test JSON response is handled correctly."""
     aresponses.add(
         "example.com",
@@ -24,13 +28,11 @@ async def test_json_request(aresponses: ResponsesMockServer) -> None:
         aresponses.Response(
             status=200,
             headers={"Content-Type": "application/json"},
-            text='{"status": "ok"}',
+            body=b'{"status": "ok"}',
         ),
     )
-    async with aiohttp.ClientSession() as session:
-        technove = TechnoVE("example.com", session=session)
-        response = await technove.request("/")
-        assert response["status"] == "ok"
+    response = await technove.request("/")
+    assert response["status"] == "ok"
 
 
 @pytest.mark.asyncio
@@ -43,7 +45,7 @@ async def test_json_request_internal_session(aresponses: ResponsesMockServer) ->
         aresponses.Response(
             status=200,
             headers={"Content-Type": "application/json"},
-            text='{"status": "ok"}',
+            body=b'{"status": "ok"}',
         ),
     )
     async with TechnoVE("example.com") as technove:
@@ -52,7 +54,9 @@ async def test_json_request_internal_session(aresponses: ResponsesMockServer) ->
 
 
 @pytest.mark.asyncio
-async def test_text_request(aresponses: ResponsesMockServer) -> None:
+async def test_text_request(
+    aresponses: ResponsesMockServer, technove: TechnoVE
+) -> None:
     """Test plain text response is handled correctly."""
     aresponses.add(
         "example.com",
@@ -61,17 +65,17 @@ async def test_text_request(aresponses: ResponsesMockServer) -> None:
         aresponses.Response(
             status=200,
             headers={"Content-Type": "text/plain"},
-            text="ok",
+            body=b"ok",
         ),
     )
-    async with aiohttp.ClientSession() as session:
-        technove = TechnoVE("example.com", session=session)
-        response = await technove.request("/")
-        assert response == "ok"
+    response = await technove.request("/")
+    assert response == "ok"
 
 
 @pytest.mark.asyncio
-async def test_post_request(aresponses: ResponsesMockServer) -> None:
+async def test_post_request(
+    aresponses: ResponsesMockServer, technove: TechnoVE
+) -> None:
     """Test POST requests are handled correctly."""
     aresponses.add(
         "example.com",
@@ -80,24 +84,24 @@ async def test_post_request(aresponses: ResponsesMockServer) -> None:
         aresponses.Response(
             status=200,
             headers={"Content-Type": "application/json"},
-            text='{"status": "ok"}',
+            body=b'{"status": "ok"}',
         ),
     )
-    async with aiohttp.ClientSession() as session:
-        technove = TechnoVE("example.com", session=session)
-        response = await technove.request("/", method="POST")
-        assert response["status"] == "ok"
+    response = await technove.request("/", method="POST")
+    assert response["status"] == "ok"
 
 
 @pytest.mark.asyncio
-async def test_backoff(aresponses: ResponsesMockServer) -> None:
+async def test_backoff(
+    aresponses: ResponsesMockServer, make_technove: Callable[..., TechnoVE]
+) -> None:
     """Test requests are handled with retries."""
 
     async def response_handler(_: aiohttp.ClientResponse) -> Response:
         """Response handler for this test."""
-        await asyncio.sleep(0.2)
+        await asyncio.sleep(0.11)
         return aresponses.Response(
-            body='{"status": "nok"}', headers={"Content-Type": "application/json"}
+            body=b'{"status": "nok"}', headers={"Content-Type": "application/json"}
         )
 
     aresponses.add(
@@ -114,55 +118,114 @@ async def test_backoff(aresponses: ResponsesMockServer) -> None:
         aresponses.Response(
             status=200,
             headers={"Content-Type": "application/json"},
-            text='{"status": "ok"}',
+            body=b'{"status": "ok"}',
         ),
     )
 
-    async with aiohttp.ClientSession() as session:
-        technove = TechnoVE("example.com", session=session, request_timeout=0.1)
-        response = await technove.request("/")
-        assert response["status"] == "ok"
+    technove = make_technove(request_timeout=0.1, max_retries=2, backoff_base=0.01)
+    response = await technove.request("/")
+    assert response["status"] == "ok"
 
 
 @pytest.mark.asyncio
-async def test_timeout(aresponses: ResponsesMockServer) -> None:
+async def test_timeout(
+    aresponses: ResponsesMockServer, make_technove: Callable[..., TechnoVE]
+) -> None:
     """Test request timeout from TechnoVE."""
 
     # Faking a timeout by sleeping
     async def response_handler(_: aiohttp.ClientResponse) -> Response:
         """Response handler for this test."""
-        await asyncio.sleep(0.2)
-        return aresponses.Response(body="Vive la poutine!")
+        await asyncio.sleep(0.11)
+        return aresponses.Response(body=b"Vive la poutine!")
 
-    # Backoff will try 3 times
-    aresponses.add("example.com", "/", "GET", response_handler)
-    aresponses.add("example.com", "/", "GET", response_handler)
-    aresponses.add("example.com", "/", "GET", response_handler)
+    # The first try and the 2 retries all time out
+    aresponses.add("example.com", "/", "GET", response_handler, repeat=3)
 
-    async with aiohttp.ClientSession() as session:
-        technove = TechnoVE("example.com", session=session, request_timeout=0.1)
-        with pytest.raises(TechnoVEConnectionError):
-            assert await technove.request("/")
+    technove = make_technove(request_timeout=0.1, max_retries=2, backoff_base=0.01)
+    with pytest.raises(TechnoVEConnectionError):
+        assert await technove.request("/")
 
 
 @pytest.mark.asyncio
-async def test_http_error400(aresponses: ResponsesMockServer) -> None:
+async def test_max_inflight(
+    aresponses: ResponsesMockServer, make_technove: Callable[..., TechnoVE]
+) -> None:
+    """Test that concurrent requests are limited by max_inflight."""
+    inflight = 0
+    max_seen = 0
+
+    async def response_handler(_: aiohttp.ClientResponse) -> Response:
+        """Response handler for this test."""
+        nonlocal inflight, max_seen
+        inflight += 1
+        max_seen = max(max_seen, inflight)
+        await asyncio.sleep(0.01)
+        inflight -= 1
+        return aresponses.Response(
+            body=b'{"status": "ok"}', headers={"Content-Type": "application/json"}
+        )
+
+    aresponses.add("example.com", "/", "GET", response_handler, repeat=4)
+
+    technove = make_technove(max_inflight=2)
+    await asyncio.gather(*(technove.request("/") for _ in range(4)))
+    assert max_seen == 2
+
+
+@pytest.mark.asyncio
+async def test_settings_changed(
+    aresponses: ResponsesMockServer, technove: TechnoVE
+) -> None:
+    """Test that settings changed after creation apply to the next requests."""
+
+    async def slow_handler(_: aiohttp.ClientResponse) -> Response:
+        """Response handler timing out the request."""
+        await asyncio.sleep(0.11)
+        return aresponses.Response(body=b"Vive la poutine!")
+
+    aresponses.add(
+        "example.org",
+        "/",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            body=b'{"status": "ok"}',
+        ),
+    )
+    aresponses.add("example.org", "/slow", "GET", slow_handler)
+
+    technove.station_ip = "example.org"
+    response = await technove.request("/")
+    assert response["status"] == "ok"
+
+    technove.request_timeout = 0.1
+    technove.max_retries = 0
+    with pytest.raises(TechnoVEConnectionTimeoutError):
+        await technove.request("/slow")
+
+
+@pytest.mark.asyncio
+async def test_http_error400(
+    aresponses: ResponsesMockServer, technove: TechnoVE
+) -> None:
     """Test HTTP 404 response handling."""
     aresponses.add(
         "example.com",
         "/",
         "GET",
-        aresponses.Response(text="syrop!", status=404),
+        aresponses.Response(body=b"syrop!", status=404),
     )
 
-    async with aiohttp.ClientSession() as session:
-        technove = TechnoVE("example.com", session=session)
-        with pytest.raises(TechnoVEError):
-            assert await technove.request("/")
+    with pytest.raises(TechnoVEError):
+        assert await technove.request("/")
 
 
 @pytest.mark.asyncio
-async def test_http_error500(aresponses: ResponsesMockServer) -> None:
+async def test_http_error500(
+    aresponses: ResponsesMockServer, technove: TechnoVE
+) -> None:
     """Test HTTP 500 response handling."""
     aresponses.add(
         "example.com",
@@ -175,14 +238,35 @@ async def test_http_error500(aresponses: ResponsesMockServer) -> None:
         ),
     )
 
-    async with aiohttp.ClientSession() as session:
-        technove = TechnoVE("example.com", session=session)
-        with pytest.raises(TechnoVEError):
-            assert await technove.request("/")
+    with pytest.raises(TechnoVEError):
+        assert await technove.request("/")
 
 
 @pytest.mark.asyncio
-async def test_update_empty_responses(aresponses: ResponsesMockServer) -> None:
+async def test_http_error500_invalid_json(
+    aresponses: ResponsesMockServer, technove: TechnoVE
+) -> None:
+    """Test HTTP 500 response handling with a malformed JSON body."""
+    aresponses.add(
+        "example.com",
+        "/",
+        "GET",
+        aresponses.Response(
+            body=b"\xffnok",
+            status=500,
+            headers={"Content-Type": "application/json"},
+        ),
+    )
+
+    with pytest.raises(TechnoVEError) as error:
+        await technove.request("/")
+    assert error.value.args == (500, {"message": "\ufffdnok"})
+
+
+@pytest.mark.asyncio
+async def test_update_empty_responses(
+    aresponses: ResponsesMockServer, technove: TechnoVE
+) -> None:
     """Test failure handling of data request TechnoVE device state."""
     aresponses.add(
         "example.com",
@@ -191,17 +275,17 @@ async def test_update_empty_responses(aresponses: ResponsesMockServer) -> None:
         aresponses.Response(
             status=200,
             headers={"Content-Type": "application/json"},
-            text="{}",
+            body=b"{}",
         ),
     )
-    async with aiohttp.ClientSession() as session:
-        technove = TechnoVE("example.com", session=session)
-        with pytest.raises(TechnoVEError):
-            await technove.update()
+    with pytest.raises(TechnoVEError):
+        await technove.update()
 
 
 @pytest.mark.asyncio
-async def test_update_partial_responses(aresponses: ResponsesMockServer) -> None:
+async def test_update_partial_responses(
+    aresponses: ResponsesMockServer, technove: TechnoVE
+) -> None:
     """Test handling of data request TechnoVE device state."""
     aresponses.add(
         "example.com",
@@ -210,17 +294,17 @@ async def test_update_partial_responses(aresponses: ResponsesMockServer) -> None
         aresponses.Response(
             status=200,
             headers={"Content-Type": "application/json"},
-            text='{"name":"testing"}',
+            body=b'{"name":"testing"}',
         ),
     )
-    async with aiohttp.ClientSession() as session:
-        technove = TechnoVE("example.com", session=session)
-        station = await technove.update()
-        assert station.info.name == "testing"
+    station = await technove.update()
+    assert station.info.name == "testing"
 
 
 @pytest.mark.asyncio
-async def test_update_unknown_status(aresponses: ResponsesMockServer) -> None:
+async def test_update_unknown_status(
+    aresponses: ResponsesMockServer, technove: TechnoVE
+) -> None:
     """Test handling of unknown status received from the API."""
     aresponses.add(
         "example.com",
@@ -229,18 +313,18 @@ async def test_update_unknown_status(aresponses: ResponsesMockServer) -> None:
         aresponses.Response(
             status=200,
             headers={"Content-Type": "application/json"},
-            text='{"name":"testing", "status":"1234"}',
+            body=b'{"name":"testing", "status":"1234"}',
         ),
     )
-    async with aiohttp.ClientSession() as session:
-        technove = TechnoVE("example.com", session=session)
-        station = await technove.update()
-        assert station.info.name == "testing"
-        assert station.info.status == Status.UNKNOWN
+    station = await technove.update()
+    assert station.info.name == "testing"
+    assert station.info.status == Status.UNKNOWN
 
 
 @pytest.mark.asyncio
-async def test_set_auto_charge(aresponses: ResponsesMockServer) -> None:
+async def test_set_auto_charge(
+    aresponses: ResponsesMockServer, technove: TechnoVE
+) -> None:
     """Test that enabling auto_charge calls the right API."""
     aresponses.add(
         "example.com",
@@ -248,18 +332,23 @@ async def test_set_auto_charge(aresponses: ResponsesMockServer) -> None:
         "POST",
         aresponses.Response(
             status=200,
-            headers={"Content-Type": "plain/text"},
-            text="ok",
+            headers={"Content-Type": "text/plain"},
+            body=b"ok",
         ),
     )
-    async with aiohttp.ClientSession() as session:
-        technove = TechnoVE("example.com", session=session)
-        await technove.set_auto_charge(enabled=True)
-        aresponses.assert_plan_strictly_followed()
+    await technove.set_auto_charge(enabled=True)
+    aresponses.assert_plan_strictly_followed()
+    request = aresponses.history[0].request
+    assert request.content_type == "application/json"
+    assert await request.read() == b'{"activated":true}'
 
 
 @pytest.mark.asyncio
-async def test_set_charging_enabled(aresponses: ResponsesMockServer) -> None:
+async def test_set_charging_enabled(
+    aresponses: ResponsesMockServer,
+    technove: TechnoVE,
+    station_no_auto_charge: Station,
+) -> None:
     """Test that changing charging_enabled calls the right API."""
     aresponses.add(
         "example.com",
@@ -267,8 +356,8 @@ async def test_set_charging_enabled(aresponses: ResponsesMockServer) -> None:
         "GET",
         aresponses.Response(
             status=200,
-            headers={"Content-Type": "plain/text"},
-            text="ok",
+            headers={"Content-Type": "text/plain"},
+            body=b"ok",
         ),
     )
     aresponses.add(
@@ -277,16 +366,14 @@ async def test_set_charging_enabled(aresponses: ResponsesMockServer) -> None:
         "GET",
         aresponses.Response(
             status=200,
-            headers={"Content-Type": "plain/text"},
-            text="ok",
+            headers={"Content-Type": "text/plain"},
+            body=b"ok",
         ),
     )
-    async with aiohttp.ClientSession() as session:
-        technove = TechnoVE("example.com", session=session)
-        technove.station = Station({"auto_charge": False})
-        await technove.set_charging_enabled(enabled=True)
-        await technove.set_charging_enabled(enabled=False)
-        aresponses.assert_plan_strictly_followed()
+    technove.station = station_no_auto_charge
+    await technove.set_charging_enabled(enabled=True)
+    await technove.set_charging_enabled(enabled=False)
+    aresponses.assert_plan_strictly_followed()
 
 
 @pytest.mark.asyncio
@@ -299,7 +386,11 @@ async def test_set_charging_enabled_auto_charge() -> None:
 
 
 @pytest.mark.asyncio
-async def test_set_max_current(aresponses: ResponsesMockServer) -> None:
+async def test_set_max_current(
+    aresponses: ResponsesMockServer,
+    technove: TechnoVE,
+    station_sharing_off: Station,
+) -> None:
     """Test that changing set_max_current calls the right API."""
     aresponses.add(
         "example.com",
@@ -307,19 +398,21 @@ async def test_set_max_current(aresponses: ResponsesMockServer) -> None:
         "POST",
         aresponses.Response(
             status=200,
-            headers={"Content-Type": "plain/text"},
-            text="ok",
+            headers={"Content-Type": "text/plain"},
+            body=b"ok",
         ),
     )
-    async with aiohttp.ClientSession() as session:
-        technove = TechnoVE("example.com", session=session)
-        technove.station = Station({"maxStationCurrent": 32, "inSharingMode": False})
-        await technove.set_max_current(32)
-        aresponses.assert_plan_strictly_followed()
+    technove.station = station_sharing_off
+    await technove.set_max_current(32)
+    aresponses.assert_plan_strictly_followed()
+    request = aresponses.history[0].request
+    assert await request.json() == {" stationNumber": 1, "current": 32}
 
 
 @pytest.mark.asyncio
-async def test_set_max_current_sharing_mode(aresponses: ResponsesMockServer) -> None:
+async def test_set_max_current_sharing_mode(
+    aresponses: ResponsesMockServer, technove: TechnoVE
+) -> None:
     """Test failure when setting the max current and in_sharing_mode is enabled."""
     aresponses.add(
         "example.com",
@@ -327,30 +420,350 @@ async def test_set_max_current_sharing_mode(aresponses: ResponsesMockServer) ->
         "POST",
         aresponses.Response(
             status=200,
-            headers={"Content-Type": "plain/text"},
-            text="bad",
+            headers={"Content-Type": "text/plain"},
+            body=b"bad",
         ),
     )
-    async with aiohttp.ClientSession() as session:
-        technove = TechnoVE("example.com", session=session)
-        technove.station = Station({"maxStationCurrent": 32, "inSharingMode": True})
-        with pytest.raises(TechnoVEError):
-            await technove.set_max_current(32)
+    technove.station = Station({"maxStationCurrent": 32, "inSharingMode": True})
+    with pytest.raises(TechnoVEError):
+        await technove.set_max_current(32)
 
 
 @pytest.mark.asyncio
-async def test_set_max_current_too_low() -> None:
+async def test_set_max_current_too_low(station_sharing_off: Station) -> None:
     """Test failure when setting the max current below 8."""
     technove = TechnoVE("example.com")
-    technove.station = Station({"maxStationCurrent": 32, "inSharingMode": False})
+    technove.station = station_sharing_off
     with pytest.raises(TechnoVEOutOfBoundError):
         await technove.set_max_current(2)
 
 
 @pytest.mark.asyncio
-async def test_set_max_current_too_high() -> None:
+async def test_set_max_current_too_high(station_sharing_off: Station) -> None:
     """Test failure when setting the max current below 0."""
     technove = TechnoVE("example.com")
-    technove.station = Station({"maxStationCurrent": 32, "inSharingMode": False})
+    technove.station = station_sharing_off
+    with pytest.raises(TechnoVEOutOfBoundError):
+        await technove.set_max_current(48)
+
+
+@pytest.mark.asyncio
+async def test_batch(aresponses: ResponsesMockServer, technove: TechnoVE) -> None:
+    """Test that batch sends every command, then refreshes the station once."""
+    aresponses.add(
+        "example.com",
+        "/station/set/automatic",
+        "POST",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "text/plain"},
+            body=b"ok",
+        ),
+    )
+    aresponses.add(
+        "example.com",
+        "/station/control/partage",
+        "POST",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "text/plain"},
+            body=b"ok",
+        ),
+    )
+    aresponses.add(
+        "example.com",
+        "/station/get/info",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            body=b'{"name":"testing", "auto_charge": true}',
+        ),
+    )
+    station = await technove.batch(
+        technove.set_auto_charge(enabled=True),
+        technove.set_max_current(16),
+    )
+    assert station.info.auto_charge
+    # The commands are sent concurrently, their order is not guaranteed.
+    aresponses.assert_no_unused_routes()
+
+
+@pytest.mark.asyncio
+async def test_batch_pending_update(
+    aresponses: ResponsesMockServer, technove: TechnoVE
+) -> None:
+    """Test that batch doesn't reuse an update started before its commands."""
+    polling = asyncio.Event()
+
+    async def response_handler(_: aiohttp.ClientResponse) -> Response:
+        """Response handler for this test."""
+        polling.set()
+        await asyncio.sleep(0.05)
+        return aresponses.Response(
+            body=b'{"auto_charge": false}',
+            headers={"Content-Type": "application/json"},
+        )
+
+    aresponses.add("example.com", "/station/get/info", "GET", response_handler)
+    aresponses.add(
+        "example.com",
+        "/station/set/automatic",
+        "POST",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "text/plain"},
+            body=b"ok",
+        ),
+    )
+    aresponses.add(
+        "example.com",
+        "/station/get/info",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            body=b'{"auto_charge": true}',
+        ),
+    )
+    poll = asyncio.create_task(technove.update())
+    await polling.wait()
+    station = await technove.batch(technove.set_auto_charge(enabled=True))
+    assert station.info.auto_charge
+    await poll
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_update_after_command(
+    aresponses: ResponsesMockServer, technove: TechnoVE
+) -> None:
+    """Test that an update after a command doesn't reuse an older update."""
+    polling = asyncio.Event()
+
+    async def response_handler(_: aiohttp.ClientResponse) -> Response:
+        """Response handler for this test."""
+        polling.set()
+        await asyncio.sleep(0.05)
+        return aresponses.Response(
+            body=b'{"auto_charge": false}',
+            headers={"Content-Type": "application/json"},
+        )
+
+    aresponses.add("example.com", "/station/get/info", "GET", response_handler)
+    aresponses.add(
+        "example.com",
+        "/station/set/automatic",
+        "POST",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "text/plain"},
+            body=b"ok",
+        ),
+    )
+    aresponses.add(
+        "example.com",
+        "/station/get/info",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            body=b'{"auto_charge": true}',
+        ),
+    )
+    poll = asyncio.create_task(technove.update())
+    await polling.wait()
+    await technove.set_auto_charge(enabled=True)
+    station = await technove.update()
+    assert station.info.auto_charge
+    assert not (await poll).info.auto_charge
+    assert technove.station is station
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_update_concurrent_calls(
+    aresponses: ResponsesMockServer, technove: TechnoVE
+) -> None:
+    """Test that concurrent updates share a single request to the station."""
+    aresponses.add(
+        "example.com",
+        "/station/get/info",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            body=b'{"name":"testing"}',
+        ),
+    )
+    first, second = await asyncio.gather(technove.update(), technove.update())
+    assert first is second
+    assert first.info.name == "testing"
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_update_cache_ttl(
+    aresponses: ResponsesMockServer, make_technove: Callable[..., TechnoVE]
+) -> None:
+    """Test that updates within cache_ttl reuse the last station data."""
+    aresponses.add(
+        "example.com",
+        "/station/get/info",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            body=b'{"name":"testing"}',
+        ),
+    )
+    technove = make_technove(cache_ttl=60)
+    first = await technove.update()
+    second = await technove.update()
+    assert first is second
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_update_cache_ttl_command(
+    aresponses: ResponsesMockServer, make_technove: Callable[..., TechnoVE]
+) -> None:
+    """Test that a command invalidates the cached station data."""
+    aresponses.add(
+        "example.com",
+        "/station/get/info",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            body=b'{"auto_charge": false}',
+        ),
+    )
+    aresponses.add(
+        "example.com",
+        "/station/set/automatic",
+        "POST",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "text/plain"},
+            body=b"ok",
+        ),
+    )
+    aresponses.add(
+        "example.com",
+        "/station/get/info",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            body=b'{"auto_charge": true}',
+        ),
+    )
+    technove = make_technove(cache_ttl=60)
+    assert not (await technove.update()).info.auto_charge
+    await technove.set_auto_charge(enabled=True)
+    assert (await technove.update()).info.auto_charge
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_update_cache_ttl_pending_update(
+    aresponses: ResponsesMockServer, make_technove: Callable[..., TechnoVE]
+) -> None:
+    """Test that an update started before a command is not cached."""
+    polling = asyncio.Event()
+
+    async def response_handler(_: aiohttp.ClientResponse) -> Response:
+        """Response handler for this test."""
+        polling.set()
+        await asyncio.sleep(0.05)
+        return aresponses.Response(
+            body=b'{"auto_charge": false}',
+            headers={"Content-Type": "application/json"},
+        )
+
+    aresponses.add("example.com", "/station/get/info", "GET", response_handler)
+    aresponses.add(
+        "example.com",
+        "/station/set/automatic",
+        "POST",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "text/plain"},
+            body=b"ok",
+        ),
+    )
+    aresponses.add(
+        "example.com",
+        "/station/get/info",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            body=b'{"auto_charge": true}',
+        ),
+    )
+    technove = make_technove(cache_ttl=60)
+    poll = asyncio.create_task(technove.update())
+    await polling.wait()
+    await technove.set_auto_charge(enabled=True)
+    await poll
+    assert (await technove.update()).info.auto_charge
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_shared_client(aresponses: ResponsesMockServer) -> None:
+    """Test that get_shared reuses one client per station until closed."""
+    aresponses.add(
+        "example.com",
+        "/",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            body=b'{"status": "ok"}',
+        ),
+    )
+    technove = get_shared("example.com")
+    assert get_shared("example.com") is technove
+    assert get_shared("example.org") is not technove
+    response = await technove.request("/")
+    assert response["status"] == "ok"
+    session = technove.session
+    assert session is not None
+
+    await close_shared()
+    assert session.closed
+    assert get_shared("example.com") is not technove
+    await close_shared()
+
+
+@pytest.mark.asyncio
+async def test_shared_client_closed(aresponses: ResponsesMockServer) -> None:
+    """Test that a shared client closed by one caller still works for others."""
+    aresponses.add(
+        "example.com",
+        "/",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            body=b'{"status": "ok"}',
+        ),
+        repeat=2,
+    )
+    async with get_shared("example.com") as technove:
+        await technove.request("/")
+    response = await get_shared("example.com").request("/")
+    assert response["status"] == "ok"
+    await close_shared()
+
+
+@pytest.mark.asyncio
+async def test_set_max_current_out_of_bound_sharing_mode() -> None:
+    """Test that bounds are checked before the sharing mode."""
+    technove = TechnoVE("example.com")
+    technove.station = Station({"maxStationCurrent": 32, "inSharingMode": True})
     with pytest.raises(TechnoVEOutOfBoundError):
         await technove.set_max_current(48)